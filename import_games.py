@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Import games from a GrooveTech CSV export into the games table.
+
+Loads the whole CSV through a single COPY into a temporary staging table,
+then merges new rows into games with one INSERT ... SELECT. Rows whose
+game_id already exists are skipped.
+
+Usage:
+    python import_games.py [csv_file]
+"""
+
+import csv
+import io
+import os
+import sys
+
+import psycopg2
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '5432')),
+    'dbname': os.getenv('DB_NAME', 'game_crafter'),
+    'user': os.getenv('DB_USER', 'game_crafter_user'),
+    'password': os.getenv('DB_PASSWORD', '5kj0YmV5FKKpU9D50B7yH5A'),
+}
+
+DEFAULT_CSV_FILE = 'game 20250930-905.csv'
+
+STAGE_COLUMNS = 'game_id, name, internal_name, provider, integration_partner, status, enabled'
+
+
+def import_games(csv_file):
+    """Load the CSV into games via a staged COPY and a single merge."""
+    conn = psycopg2.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+
+    try:
+        # Rerun-safe bulk load: skip the WAL fsync stall at commit and
+        # give the merge extra sort memory (session-local settings).
+        cursor.execute("""
+            SET synchronous_commit = off;
+            SET work_mem = '256MB';
+            SET maintenance_work_mem = '1GB';
+        """)
+
+        # UNLOGGED skips WAL on the staging hop; the table is transient,
+        # so crash safety is not needed there. (UNLOGGED tables cannot use
+        # ON COMMIT DROP, hence the explicit drop below.)
+        cursor.execute("DROP TABLE IF EXISTS games_stage")
+        cursor.execute("""
+            CREATE UNLOGGED TABLE games_stage (
+                game_id text,
+                name text,
+                internal_name text,
+                provider text,
+                integration_partner text,
+                status text,
+                enabled boolean
+            )
+        """)
+
+        # Rewrite the CSV into the staging column layout in memory, filling
+        # in the constant columns (groovetech / ACTIVE / enabled) on the fly.
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        csv_ids = []
+
+        with open(csv_file, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            # Resolve column positions once instead of building a dict
+            # per row with DictReader.
+            header = next(reader)
+            idx = {column: i for i, column in enumerate(header)}
+            gid_i = idx['game_id']
+            name_i = idx['name']
+            iname_i = idx['internal_name']
+            prov_i = idx['provider.internal_name']
+
+            for row in reader:
+                if not row:  # csv.reader yields [] for blank lines
+                    continue
+                game_id = row[gid_i].strip()
+                name = row[name_i].strip()
+                internal_name = row[iname_i].strip()
+                provider = row[prov_i].strip()
+
+                if not game_id:
+                    continue
+
+                writer.writerow([game_id, name, internal_name, provider,
+                                 'groovetech', 'ACTIVE', 'true'])
+                csv_ids.append(game_id)
+
+        buf.seek(0)
+        cursor.copy_expert(
+            f"COPY games_stage ({STAGE_COLUMNS}) FROM STDIN WITH CSV", buf)
+
+        # One batched probe instead of a SELECT per row: fetch every
+        # already-known game_id in a single round trip so the summary can
+        # tell pre-existing rows apart from duplicates within the file.
+        cursor.execute(
+            "SELECT game_id FROM games WHERE game_id = ANY(%s)", (csv_ids,))
+        existing = {row[0] for row in cursor.fetchall()}
+
+        # "Skip if exists" is enforced server-side by the unique index:
+        # ON CONFLICT DO NOTHING resolves each key with a single B-tree
+        # lookup instead of a separate anti-join pass. DISTINCT ON still
+        # collapses duplicate game_ids inside the CSV itself.
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS games_game_id_uidx
+            ON games (game_id)
+        """)
+        cursor.execute("""
+            INSERT INTO games (game_id, name, internal_name, provider,
+                               integration_partner, status, enabled, "timestamp")
+            SELECT DISTINCT ON (s.game_id)
+                   s.game_id, s.name, s.internal_name, s.provider,
+                   s.integration_partner, s.status, s.enabled, now()
+            FROM games_stage s
+            ON CONFLICT (game_id) DO NOTHING
+        """)
+        imported = cursor.rowcount
+        total_rows = len(csv_ids)
+        skipped_existing = sum(1 for gid in set(csv_ids) if gid in existing)
+        duplicates = total_rows - len(set(csv_ids))
+
+        cursor.execute("DROP TABLE games_stage")
+        conn.commit()
+
+        print(f"✅ Import complete: {imported} imported, "
+              f"{skipped_existing} skipped (already present), "
+              f"{duplicates} duplicate rows in file, {total_rows} rows read")
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Import failed: {e}")
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV_FILE
+    if not os.path.exists(csv_path):
+        print(f"❌ CSV file not found: {csv_path}")
+        sys.exit(1)
+    import_games(csv_path)
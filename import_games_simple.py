@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Simple full refresh of the GrooveTech game catalog: delete every
+groovetech game, then reload the catalog from the CSV with one COPY.
+
+Use this when the export is authoritative and per-row merging is not
+needed; import_games_corrected.py upserts instead.
+
+Usage:
+    python import_games_simple.py [csv_file]
+"""
+
+import csv
+import io
+import logging
+import os
+import sys
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '5432')),
+    'dbname': os.getenv('DB_NAME', 'game_crafter'),
+    'user': os.getenv('DB_USER', 'game_crafter_user'),
+    'password': os.getenv('DB_PASSWORD', '5kj0YmV5FKKpU9D50B7yH5A'),
+    # TLS per deployment policy (e.g. DB_SSLMODE=require through a pooler);
+    # keepalives stop pooler- or NAT-held idle connections from being
+    # silently dropped mid-batch, and application_name makes these jobs
+    # identifiable in pg_stat_activity.
+    'sslmode': os.getenv('DB_SSLMODE', 'prefer'),
+    'application_name': 'import_games_simple',
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    # Batch jobs should never be killed by a server-side statement timeout.
+    'options': '-c statement_timeout=0',
+}
+
+DEFAULT_CSV_FILE = 'game 20250930-905.csv'
+
+GAMES_COLUMNS = 'game_id, name, internal_name, provider, integration_partner'
+
+
+def import_games(csv_file):
+    """Replace all groovetech games with the contents of the CSV."""
+    conn = psycopg2.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+
+    try:
+        # One transaction for the whole refresh: a failure mid-load rolls
+        # back to the original catalog instead of leaving it half-deleted,
+        # and there is exactly one WAL fsync at the end rather than one
+        # per intermediate commit. synchronous_commit is LOCAL to this
+        # transaction and safe to skip — the CSV can always be replayed.
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        cursor.execute("SET LOCAL maintenance_work_mem = '1GB'")
+
+        # Per-row trigger calls and B-tree maintenance dominate bulk
+        # loads, scaling with rows x indexes. User triggers are off for
+        # the duration of the transaction and the non-unique game_id
+        # index is rebuilt once from the loaded data instead of split
+        # row by row. Plain DROP/CREATE (not CONCURRENTLY, which cannot
+        # run in a transaction) is fine here: this is a maintenance run
+        # that already takes an exclusive slice of the games rows.
+        cursor.execute("ALTER TABLE games DISABLE TRIGGER USER")
+        cursor.execute("DROP INDEX IF EXISTS idx_games_game_id")
+
+        cursor.execute(
+            "DELETE FROM games WHERE integration_partner = 'groovetech'")
+        deleted = cursor.rowcount
+        logger.info("🗑️  Removed %d existing groovetech games", deleted)
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        total_rows = 0
+
+        with open(csv_file, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            # Hoisted out of the per-row loop: key constants and a bound
+            # dict.get save a handful of dict/attribute lookups per row,
+            # which adds up on large exports.
+            gid_key, name_key = 'game_id', 'name'
+            iname_key, prov_key = 'internal_name', 'provider.internal_name'
+            get = dict.get
+            writerow = writer.writerow
+            for row in reader:
+                game_id = get(row, gid_key, '').strip()
+                if not game_id:
+                    continue
+                writerow([
+                    game_id,
+                    get(row, name_key, '').strip(),
+                    get(row, iname_key, '').strip(),
+                    get(row, prov_key, '').strip(),
+                    'groovetech',
+                ])
+                total_rows += 1
+
+        buf.seek(0)
+        cursor.copy_expert(
+            f"COPY games ({GAMES_COLUMNS}) FROM STDIN WITH (FORMAT CSV)", buf)
+
+        cursor.execute("CREATE INDEX idx_games_game_id ON games (game_id)")
+        cursor.execute("ALTER TABLE games ENABLE TRIGGER USER")
+
+        # Display-only verification: an ANALYZE-refreshed planner
+        # estimate is an O(1) pg_class lookup where COUNT(*) rescans the
+        # table we just wrote. After the full refresh every groovetech
+        # row came from this CSV, so total_rows is the exact figure.
+        cursor.execute("ANALYZE games")
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'games'")
+        estimate = cursor.fetchone()[0]
+        conn.commit()
+        logger.info("✅ Import complete: %d rows loaded, "
+                    "~%d games in table (planner estimate)",
+                    total_rows, estimate)
+    except Exception as e:
+        conn.rollback()
+        logger.error("❌ Import failed: %s", e)
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV_FILE
+    if not os.path.exists(csv_path):
+        logger.error("❌ CSV file not found: %s", csv_path)
+        sys.exit(1)
+    import_games(csv_path)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+One-off migration of historical data from Postgres into ClickHouse.
+
+Copies the analytical tables the backoffice reads from ClickHouse
+(tucanbit_analytics.*, tucanbit_financial.*) out of the operational
+Postgres database. Each table is streamed through a server-side cursor
+in fixed-size chunks so memory stays flat regardless of table size, and
+ClickHouse receives inserts at its preferred block size.
+
+Usage:
+    python migrate_postgres_to_clickhouse.py
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import psycopg2
+import psycopg2.extras
+from clickhouse_driver import Client
+
+# ClickHouse stores metadata/claimed_earnings as strings, so there is no
+# point deserializing jsonb into dicts only to re-serialize them: have
+# psycopg2 hand back the raw JSON text untouched.
+psycopg2.extras.register_default_jsonb(globally=True, loads=lambda value: value)
+
+PG_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '5432')),
+    'dbname': os.getenv('DB_NAME', 'game_crafter'),
+    'user': os.getenv('DB_USER', 'game_crafter_user'),
+    'password': os.getenv('DB_PASSWORD', '5kj0YmV5FKKpU9D50B7yH5A'),
+}
+
+CH_CONFIG = {
+    'host': os.getenv('CLICKHOUSE_HOST', 'localhost'),
+    'port': int(os.getenv('CLICKHOUSE_PORT', '9000')),
+    'database': os.getenv('CLICKHOUSE_DB', 'tucanbit_analytics'),
+    'user': os.getenv('CLICKHOUSE_USER', 'tucanbit'),
+    'password': os.getenv('CLICKHOUSE_PASSWORD', 'tucanbit_clickhouse_password'),
+    # The migration is network-bound on large tables; LZ4 roughly halves
+    # wire bytes for this data. Needs the lz4 + clickhouse-cityhash
+    # packages; set CLICKHOUSE_COMPRESSION= (empty) to turn it off.
+    'compression': os.getenv('CLICKHOUSE_COMPRESSION', 'lz4') or False,
+}
+
+# 50k rows per chunk keeps peak memory bounded and lands inside the
+# 10k-100k block size ClickHouse merges most efficiently.
+CHUNK_SIZE = 50000
+
+# psycopg2 connections must not be shared across threads, so each worker
+# gets its own Postgres and ClickHouse connection.
+MAX_WORKERS = 4
+
+# The column builders emit uniform, already-typed data, so per-cell type
+# validation in the driver is pure overhead.
+CH_INSERT_SETTINGS = {'insert_block_size': 1048576}
+
+
+def stream(pg, ch, sql, to_columns, ch_table, ch_columns):
+    """Stream a Postgres query into a ClickHouse table in chunks.
+
+    Uses a server-side named cursor so Postgres never materializes the
+    full result set client-side. Each fetched chunk is handed to
+    to_columns(), which returns one list per target column, and sent
+    columnar so the driver serializes straight into native-protocol
+    blocks without an AoS-to-SoA transpose.
+
+    Fetch and insert are pipelined through a small bounded queue: a
+    producer thread keeps pulling the next chunk from Postgres while the
+    current chunk is being inserted into ClickHouse, so neither side
+    idles waiting on the other.
+    """
+    chunks = queue.Queue(maxsize=4)
+    fetch_error = []
+    stop = threading.Event()
+
+    def put_chunk(item):
+        # Bounded put that gives up once the consumer has stopped, so a
+        # failed insert can never leave the producer parked forever on a
+        # full queue.
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(cursor):
+        try:
+            while not stop.is_set():
+                rows = cursor.fetchmany(CHUNK_SIZE)
+                if not rows:
+                    break
+                if not put_chunk(rows):
+                    return
+        except Exception as e:  # noqa: BLE001 - surfaced on the consumer side
+            fetch_error.append(e)
+        finally:
+            put_chunk(None)
+
+    migrated = 0
+    with pg.cursor(name=f'mig_{ch_table.replace(".", "_")}') as cursor:
+        cursor.itersize = CHUNK_SIZE
+        cursor.execute(sql)
+        producer = threading.Thread(target=produce, args=(cursor,))
+        producer.start()
+        try:
+            while (rows := chunks.get()) is not None:
+                ch.execute(
+                    f"INSERT INTO {ch_table} ({ch_columns}) VALUES",
+                    to_columns(rows), columnar=True, types_check=False,
+                    settings=CH_INSERT_SETTINGS)
+                migrated += len(rows)
+                print(f"  ... {migrated} rows into {ch_table}")
+        finally:
+            # If the insert raised, the producer may be blocked in put()
+            # on a full queue: signal it to stop and keep draining until
+            # it exits, then let the exception propagate.
+            stop.set()
+            while producer.is_alive():
+                try:
+                    chunks.get_nowait()
+                except queue.Empty:
+                    pass
+                producer.join(timeout=0.1)
+    if fetch_error:
+        raise fetch_error[0]
+    return migrated
+
+
+def _users_columns(rows):
+    now = datetime.now()
+    return [
+        [r[0] for r in rows],
+        [r[1] or '' for r in rows],
+        [r[2] or '' for r in rows],
+        [r[3] or '' for r in rows],
+        [r[4] or '' for r in rows],
+        [r[5] or now for r in rows],
+    ]
+
+
+def migrate_users(pg, ch):
+    return stream(
+        pg, ch,
+        """
+        SELECT id::text, username, email, country, kyc_status, created_at
+        FROM users
+        """,
+        _users_columns,
+        'tucanbit_analytics.users',
+        'id, username, email, country, kyc_status, created_at')
+
+
+def _games_columns(rows):
+    now = datetime.now()
+    return [
+        [r[0] for r in rows],
+        [r[1] or '' for r in rows],
+        [r[2] or '' for r in rows],
+        [r[3] or '' for r in rows],
+        [r[4] or '' for r in rows],
+        [r[5] or '' for r in rows],
+        [r[6] or now for r in rows],
+    ]
+
+
+def migrate_games(pg, ch):
+    return stream(
+        pg, ch,
+        """
+        SELECT id::text, game_id, name, internal_name, provider,
+               integration_partner, created_at
+        FROM games
+        """,
+        _games_columns,
+        'tucanbit_analytics.games',
+        'id, game_id, name, internal_name, provider, integration_partner, created_at')
+
+
+def _financial_columns(rows):
+    now = datetime.now()
+    return [
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        [float(r[2]) for r in rows],
+        [r[3] for r in rows],
+        [float(r[4]) for r in rows],
+        [r[5] for r in rows],
+        [r[6] or now for r in rows],
+        [r[7] or now for r in rows],
+    ]
+
+
+FINANCIAL_COLUMNS = ('id, user_id, amount, currency_code, usd_amount, '
+                     'status, created_at, updated_at')
+
+
+def migrate_deposits_and_withdrawals(pg, ch):
+    """Migrate deposits and withdrawals with a single scan of transactions.
+
+    The two target tables differ only by transaction_type, so one
+    streaming pass dispatches each row into a per-target buffer instead
+    of sequentially scanning transactions twice.
+    """
+    buffers = {'deposit': [], 'withdrawal': []}
+    tables = {'deposit': 'tucanbit_financial.deposits',
+              'withdrawal': 'tucanbit_financial.withdrawals'}
+    migrated = 0
+
+    def flush(tx_type):
+        buf = buffers[tx_type]
+        if not buf:
+            return
+        ch.execute(
+            f"INSERT INTO {tables[tx_type]} ({FINANCIAL_COLUMNS}) VALUES",
+            _financial_columns(buf), columnar=True, types_check=False,
+            settings=CH_INSERT_SETTINGS)
+        buf.clear()
+
+    with pg.cursor(name='mig_financial') as cursor:
+        cursor.itersize = CHUNK_SIZE
+        cursor.execute("""
+            SELECT id::text, user_id::text, amount, currency_code,
+                   COALESCE(usd_amount_cents, 0) / 100.0, status,
+                   created_at, updated_at, transaction_type
+            FROM transactions
+            WHERE transaction_type IN ('deposit', 'withdrawal')
+        """)
+        while True:
+            rows = cursor.fetchmany(CHUNK_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                buf = buffers[row[8]]
+                buf.append(row)
+                if len(buf) >= CHUNK_SIZE:
+                    flush(row[8])
+            migrated += len(rows)
+            print(f"  ... {migrated} financial rows scanned")
+
+    flush('deposit')
+    flush('withdrawal')
+    return migrated
+
+
+def _groove_columns(rows):
+    now = datetime.now()
+    return [
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        [r[2] for r in rows],
+        [float(r[3]) for r in rows],
+        [r[4] for r in rows],
+        [r[5] for r in rows],
+        [r[6] or '' for r in rows],
+        [r[7] or '' for r in rows],
+        [r[8] or '' for r in rows],
+        [float(r[9]) if r[9] is not None else 0.0 for r in rows],
+        [r[10] or '' for r in rows],
+        [r[11] or now for r in rows],
+    ]
+
+
+def migrate_groove_transactions(pg, ch):
+    return stream(
+        pg, ch,
+        """
+        SELECT id::text, COALESCE(user_id::text, ''), type, amount, currency,
+               status, game_id, session_id, round_id, bet_amount, metadata,
+               created_at
+        FROM groove_transactions
+        """,
+        _groove_columns,
+        'tucanbit_analytics.transactions',
+        'id, user_id, transaction_type, amount, currency, status, game_id, '
+        'session_id, round_id, bet_amount, metadata, created_at')
+
+
+def _earnings_columns(rows):
+    now = datetime.now()
+    return [
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        ['cashback_earning'] * len(rows),
+        [float(r[2]) for r in rows],
+        [float(r[3]) for r in rows],
+        [''] * len(rows),
+        [r[0] for r in rows],
+        [r[4] or now for r in rows],
+        [r[5] or now for r in rows],
+    ]
+
+
+def migrate_cashback_earnings(pg, ch):
+    return stream(
+        pg, ch,
+        """
+        SELECT id::text, user_id::text, earned_amount, available_amount,
+               created_at, updated_at
+        FROM cashback_earnings
+        """,
+        _earnings_columns,
+        'tucanbit_analytics.cashback_analytics',
+        'id, user_id, transaction_type, amount, available_amount, '
+        'claimed_earnings, earning_id, created_at, updated_at')
+
+
+def _claims_columns(rows):
+    now = datetime.now()
+    return [
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        ['cashback_claim'] * len(rows),
+        [float(r[2]) for r in rows],
+        [0.0] * len(rows),
+        [r[3] or '' for r in rows],
+        [''] * len(rows),
+        [r[4] or now for r in rows],
+        [r[5] or now for r in rows],
+    ]
+
+
+def migrate_cashback_claims(pg, ch):
+    return stream(
+        pg, ch,
+        """
+        SELECT id::text, user_id::text, claim_amount, claimed_earnings,
+               created_at, updated_at
+        FROM cashback_claims
+        """,
+        _claims_columns,
+        'tucanbit_analytics.cashback_analytics',
+        'id, user_id, transaction_type, amount, available_amount, '
+        'claimed_earnings, earning_id, created_at, updated_at')
+
+
+def run_migrator(migrate):
+    """Run one migrator on its own pair of connections."""
+    pg = psycopg2.connect(**PG_CONFIG)
+    pg.set_client_encoding('UTF8')
+    ch = Client(**CH_CONFIG)
+    try:
+        print(f"🚀 {migrate.__name__} ...")
+        count = migrate(pg, ch)
+        print(f"✅ {migrate.__name__}: {count} rows migrated")
+        return count
+    finally:
+        pg.close()
+        ch.disconnect()
+
+
+if __name__ == '__main__':
+    migrators = [
+        migrate_users,
+        migrate_games,
+        migrate_deposits_and_withdrawals,
+        migrate_groove_transactions,
+        migrate_cashback_earnings,
+        migrate_cashback_claims,
+    ]
+    # The migrators touch disjoint tables, so they can run concurrently;
+    # wall clock approaches the slowest table instead of the sum.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(run_migrator, m) for m in migrators]
+        total = sum(f.result() for f in futures)
+    print(f"🎉 Migration complete: {total} rows total")
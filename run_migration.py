@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Apply a SQL migration file and verify the games schema afterwards.
+
+Used for ad-hoc application of the game-import migrations outside the
+Go migrate tooling. Connections come from a module-level pool so
+repeated runs inside a long-lived worker reuse backends instead of
+opening a fresh connection per invocation.
+
+Usage:
+    python run_migration.py <migration_file.sql>
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+
+import psycopg2.pool
+
+logger = logging.getLogger(__name__)
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '5432')),
+    'dbname': os.getenv('DB_NAME', 'game_crafter'),
+    'user': os.getenv('DB_USER', 'game_crafter_user'),
+    'password': os.getenv('DB_PASSWORD', '5kj0YmV5FKKpU9D50B7yH5A'),
+    # TLS per deployment policy (e.g. DB_SSLMODE=require through a pooler);
+    # keepalives stop pooler- or NAT-held idle connections from being
+    # silently dropped mid-batch, and application_name makes these jobs
+    # identifiable in pg_stat_activity.
+    'sslmode': os.getenv('DB_SSLMODE', 'prefer'),
+    'application_name': 'run_migration',
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    # Batch jobs should never be killed by a server-side statement timeout.
+    'options': '-c statement_timeout=0',
+}
+
+_pool = None
+
+
+def get_pool():
+    """Build the connection pool on first use.
+
+    Constructed lazily rather than at import time: the pool opens its
+    minconn connection immediately, and an unreachable database should
+    come back as the handled "Migration failed" path, not an
+    import-time traceback.
+    """
+    global _pool
+    if _pool is None:
+        _pool = psycopg2.pool.ThreadedConnectionPool(1, 10, **DB_CONFIG)
+    return _pool
+
+
+_DOLLAR_TAG = re.compile(rb'\$[A-Za-z_]*\$')
+
+
+def split_statements(sql):
+    """Split a migration blob (bytes) into individual statements.
+
+    Honours dollar-quoted bodies ($$ ... $$, $fn$ ... $fn$) and quoted
+    literals so function definitions with embedded semicolons survive
+    intact. Comments are left in place; empty fragments are dropped.
+    Operates on bytes — the file is read in binary mode and the
+    statements go to psycopg2 as bytes, so the SQL is never decoded and
+    re-encoded on the way to the server.
+    """
+    statements = []
+    start = 0
+    i = 0
+    n = len(sql)
+    while i < n:
+        ch = sql[i:i + 1]
+        if ch == b"'" or ch == b'"':
+            quote = ch
+            i += 1
+            while i < n:
+                if sql[i:i + 1] == quote:
+                    i += 1
+                    if quote == b"'" and sql[i:i + 1] == b"'":
+                        i += 1  # escaped '' inside a literal
+                        continue
+                    break
+                i += 1
+            continue
+        if ch == b'-' and sql[i:i + 2] == b'--':
+            i = sql.find(b'\n', i)
+            i = n if i < 0 else i + 1
+            continue
+        if ch == b'/' and sql[i:i + 2] == b'/*':
+            i = sql.find(b'*/', i)
+            i = n if i < 0 else i + 2
+            continue
+        if ch == b'$':
+            match = _DOLLAR_TAG.match(sql, i)
+            if match:
+                tag = match.group()
+                end = sql.find(tag, match.end())
+                i = n if end < 0 else end + len(tag)
+                continue
+        if ch == b';':
+            statement = sql[start:i].strip()
+            if statement:
+                statements.append(statement)
+            start = i + 1
+        i += 1
+    tail = sql[start:].strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
+
+def run_migration(migration_file):
+    """Execute the migration file and report the resulting games schema."""
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+    except psycopg2.Error as e:
+        logger.error("❌ Migration failed: %s", e)
+        return False
+    conn.autocommit = True
+    cursor = conn.cursor()
+
+    try:
+        # Binary mode: psycopg2 sends bytes on the wire anyway, so
+        # passing bytes through skips a decode + re-encode pass over
+        # the whole file.
+        with open(migration_file, 'rb') as file:
+            migration_sql = file.read()
+
+        # Execute statement by statement rather than as one blob: a
+        # failure now reports the exact statement, autocommit means DDL
+        # like CREATE INDEX CONCURRENTLY is allowed (it cannot run inside
+        # a transaction block), and per-statement timing shows where a
+        # slow migration spends its time.
+        statements = split_statements(migration_sql)
+        logger.info("🚀 Applying %s (%d statements) ...",
+                    migration_file, len(statements))
+        for number, statement in enumerate(statements, start=1):
+            started = time.perf_counter()
+            try:
+                cursor.execute(statement)
+            except psycopg2.Error:
+                logger.error("❌ Statement %d failed:\n%s", number,
+                             statement.decode('utf-8', errors='replace'))
+                raise
+            elapsed = time.perf_counter() - started
+            if elapsed >= 1.0:
+                first_line = statement.splitlines()[0]
+                logger.info("  ⏱  statement %d took %.1fs: %s", number,
+                            elapsed,
+                            first_line[:70].decode('utf-8', errors='replace'))
+        logger.info("✅ Migration applied")
+
+        # Verification: show the columns the import scripts rely on and
+        # a couple of row-level sanity checks. information_schema.columns
+        # joins pg_class/pg_attribute/pg_namespace under the hood, so one
+        # query over both tables costs far less than one per table; the
+        # row checks likewise collapse into a single round trip.
+        cursor.execute("""
+            SELECT table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_name IN ('games', 'groove_transactions')
+            ORDER BY table_name, ordinal_position
+        """)
+        columns_by_table = {}
+        for table_name, name, data_type in cursor.fetchall():
+            columns_by_table.setdefault(table_name, []).append(
+                (name, data_type))
+        for table_name in ('games', 'groove_transactions'):
+            logger.info("\n📋 %s columns:", table_name)
+            for name, data_type in columns_by_table.get(table_name, []):
+                logger.info("  %s: %s", name, data_type)
+
+        # Display-only sanity numbers: the planner estimate from pg_class
+        # is an O(1) lookup, where COUNT(*) is a full scan of games. The
+        # preceding ANALYZE keeps the estimate current after a migration
+        # that moved data around.
+        cursor.execute("ANALYZE games")
+        cursor.execute("""
+            SELECT (SELECT reltuples::bigint FROM pg_class
+                    WHERE relname = 'games') AS total,
+                   EXISTS(SELECT 1 FROM games WHERE game_id = '82695') AS has_sweet
+        """)
+        total, has_sweet = cursor.fetchone()
+        logger.info("\n📊 games rows: ~%d (planner estimate)", total)
+        logger.info("📊 Sweet Bonanza present: %s", has_sweet)
+        return True
+    except psycopg2.Error as e:
+        logger.error("❌ Migration failed: %s", e)
+        return False
+    finally:
+        cursor.close()
+        pool.putconn(conn)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if len(sys.argv) < 2:
+        print("Usage: python run_migration.py <migration_file.sql>")
+        sys.exit(1)
+    if not os.path.exists(sys.argv[1]):
+        logger.error("❌ Migration file not found: %s", sys.argv[1])
+        sys.exit(1)
+    sys.exit(0 if run_migration(sys.argv[1]) else 1)
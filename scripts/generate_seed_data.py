@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Generate seed SQL from a live database.
+
+Dumps the RBAC and currency configuration tables of an existing
+environment, either as idempotent INSERT ... ON CONFLICT DO NOTHING
+statements ready to paste into a seed migration (sql mode), or as CSV
+sidecars produced by server-side COPY ... TO STDOUT that a later run
+loads back through COPY + staged merge (dump/load modes). The CSV path
+skips SQL rendering on the way out and INSERT replay on the way in.
+Queries run over one in-process psycopg2 connection instead of spawning
+a psql subprocess per query, so values come back properly typed (UUIDs,
+booleans, NULLs) with no output parsing.
+
+Usage:
+    python scripts/generate_seed_data.py sql  [output_file]
+    python scripts/generate_seed_data.py dump [output_dir]
+    python scripts/generate_seed_data.py load [input_dir]
+"""
+
+import os
+import sys
+
+import psycopg2
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '5432')),
+    'dbname': os.getenv('DB_NAME', 'game_crafter'),
+    'user': os.getenv('DB_USER', 'game_crafter_user'),
+    'password': os.getenv('DB_PASSWORD', '5kj0YmV5FKKpU9D50B7yH5A'),
+}
+
+DEFAULT_OUTPUT_FILE = 'seed_data.sql'
+
+conn = psycopg2.connect(**DB_CONFIG)
+
+
+def run_query(sql):
+    """Run a query on the shared connection and return all rows."""
+    with conn.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+def build_insert(table, columns, rows):
+    """Build one multi-row INSERT, letting libpq escape every literal.
+
+    cursor.mogrify() renders each tuple with the same quoting rules the
+    server uses, so backslashes, embedded quotes, NULLs and booleans all
+    come out correct without any Python-side escaping.
+    """
+    if not rows:
+        return f"-- {table}: no rows"
+    placeholders = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    with conn.cursor() as cursor:
+        values = ",\n    ".join(
+            cursor.mogrify(placeholders, row).decode() for row in rows)
+    return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n"
+            f"    {values}\nON CONFLICT DO NOTHING;")
+
+
+# (table, columns, order_by) for every seeded table.
+SEED_TABLES = [
+    ('permissions', ('id', 'name', 'description'), 'name'),
+    ('roles', ('id', 'name', 'description'), 'name'),
+    ('role_permissions', ('id', 'role_id', 'permission_id', 'value'), 'id'),
+    ('currency_config',
+     ('currency_code', 'currency_name', 'currency_type', 'decimal_places',
+      'smallest_unit_name', 'is_active'), 'currency_code'),
+]
+
+
+def write_seed_sql(output_file):
+    """Emit one idempotent multi-row INSERT per seed table."""
+    with open(output_file, 'w', encoding='utf-8') as out:
+        for table, columns, order_by in SEED_TABLES:
+            rows = run_query(
+                f"SELECT {', '.join(columns)} FROM {table} ORDER BY {order_by}")
+            out.write(f"-- {table} ({len(rows)} rows)\n")
+            out.write(build_insert(table, columns, rows))
+            out.write('\n\n')
+            print(f"📊 {table}: {len(rows)} rows")
+    print(f"✅ Seed SQL written to {output_file}")
+
+
+def dump_seed_csvs(output_dir):
+    """Dump every seed table with server-side COPY ... TO STDOUT."""
+    os.makedirs(output_dir, exist_ok=True)
+    with conn.cursor() as cursor:
+        for table, columns, order_by in SEED_TABLES:
+            path = os.path.join(output_dir, f'seed_{table}.csv')
+            with open(path, 'wb') as out:
+                cursor.copy_expert(
+                    f"COPY (SELECT {', '.join(columns)} FROM {table} "
+                    f"ORDER BY {order_by}) TO STDOUT WITH CSV", out)
+            print(f"📊 {table} -> {path}")
+    print(f"✅ Seed CSVs written to {output_dir}")
+
+
+def load_seed_csvs(input_dir):
+    """Load seed CSVs back through COPY into a staged ON CONFLICT merge."""
+    with conn.cursor() as cursor:
+        for table, columns, _ in SEED_TABLES:
+            path = os.path.join(input_dir, f'seed_{table}.csv')
+            column_list = ', '.join(columns)
+            cursor.execute(f"DROP TABLE IF EXISTS {table}_seed_stage")
+            cursor.execute(
+                f"CREATE UNLOGGED TABLE {table}_seed_stage "
+                f"(LIKE {table} INCLUDING DEFAULTS)")
+            with open(path, 'rb') as infile:
+                cursor.copy_expert(
+                    f"COPY {table}_seed_stage ({column_list}) "
+                    f"FROM STDIN WITH CSV", infile)
+            cursor.execute(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT {column_list} FROM {table}_seed_stage "
+                f"ON CONFLICT DO NOTHING")
+            loaded = cursor.rowcount
+            cursor.execute(f"DROP TABLE {table}_seed_stage")
+            print(f"📊 {table}: {loaded} rows loaded")
+    conn.commit()
+    print(f"✅ Seed CSVs from {input_dir} applied")
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'sql'
+    target = sys.argv[2] if len(sys.argv) > 2 else None
+
+    if mode == 'sql':
+        write_seed_sql(target or DEFAULT_OUTPUT_FILE)
+    elif mode == 'dump':
+        dump_seed_csvs(target or 'seed_data')
+    elif mode == 'load':
+        load_seed_csvs(target or 'seed_data')
+    else:
+        print(f"❌ Unknown mode: {mode} (expected sql, dump or load)")
+        sys.exit(1)
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
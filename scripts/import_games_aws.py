@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Import games from a GrooveTech CSV export into the AWS (RDS) database.
+
+Upserts on game_id so the script is safe to re-run after a partial
+import. Small files are sent to Postgres in execute_values batches on a
+single core; large files are split into newline-aligned byte ranges that
+worker processes parse and COPY into a staging table concurrently before
+one merge upsert.
+
+Usage:
+    python scripts/import_games_aws.py [csv_file]
+"""
+
+import csv
+import io
+import os
+import sys
+from multiprocessing import Pool, cpu_count
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': int(os.getenv('DB_PORT', '5432')),
+    'dbname': os.getenv('DB_NAME', 'game_crafter'),
+    'user': os.getenv('DB_USER', 'game_crafter_user'),
+    'password': os.getenv('DB_PASSWORD', '5kj0YmV5FKKpU9D50B7yH5A'),
+}
+
+DEFAULT_CSV_FILE = 'game 20250930-905.csv'
+
+BATCH_SIZE = 1000
+
+# Below this size a single core keeps Postgres saturated; above it the
+# pure-Python CSV parse becomes the bottleneck and the file is split
+# across worker processes. Assumes no newlines embedded in quoted
+# fields, which holds for the GrooveTech exports.
+PARALLEL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+STAGE_TABLE = 'games_import_stage'
+
+MERGE_SQL = f"""
+    INSERT INTO games (game_id, internal_name, provider, integration_partner, name)
+    SELECT DISTINCT ON (game_id)
+           game_id, internal_name, provider, integration_partner, name
+    FROM {STAGE_TABLE}
+    ON CONFLICT (game_id) DO UPDATE SET
+        internal_name = EXCLUDED.internal_name,
+        provider = EXCLUDED.provider,
+        integration_partner = EXCLUDED.integration_partner,
+        name = EXCLUDED.name
+"""
+
+UPSERT_SQL = """
+    INSERT INTO games (game_id, internal_name, provider, integration_partner, name)
+    VALUES %s
+    ON CONFLICT (game_id) DO UPDATE SET
+        internal_name = EXCLUDED.internal_name,
+        provider = EXCLUDED.provider,
+        integration_partner = EXCLUDED.integration_partner,
+        name = EXCLUDED.name
+"""
+
+
+def get_db_connection():
+    conn = psycopg2.connect(**DB_CONFIG)
+    # Bulk-load session tuning: the import is rerun-safe, so WAL fsync
+    # on commit buys nothing, and the merge benefits from extra sort
+    # memory. All settings are session-local.
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SET synchronous_commit = off;
+            SET work_mem = '256MB';
+            SET maintenance_work_mem = '1GB';
+        """)
+    return conn
+
+
+def _ensure_game_id_index(cursor):
+    # Every upsert here relies on ON CONFLICT (game_id), but the schema
+    # migrations only ship a non-unique index on games.game_id. Create
+    # the unique index on demand so the merge works on a fresh schema.
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS games_game_id_uidx
+        ON games (game_id)
+    """)
+
+
+def _chunk_ranges(csv_file, workers):
+    """Split the file body into newline-aligned (start, end) byte ranges."""
+    size = os.path.getsize(csv_file)
+    with open(csv_file, 'rb') as file:
+        file.readline()  # skip the header line
+        body_start = file.tell()
+        step = max((size - body_start) // workers, 1)
+        starts = [body_start]
+        for _ in range(workers - 1):
+            file.seek(starts[-1] + step)
+            file.readline()  # advance to the next row boundary
+            pos = file.tell()
+            if pos >= size:
+                break
+            starts.append(pos)
+    return [(start, end) for start, end
+            in zip(starts, starts[1:] + [size]) if start < end]
+
+
+def _copy_range(args):
+    """Parse one byte range and COPY it into the staging table."""
+    csv_file, start, end, (gid_i, iname_i, prov_i, name_i) = args
+    with open(csv_file, 'rb') as file:
+        file.seek(start)
+        chunk = file.read(end - start).decode('utf-8')
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    rows = 0
+    for row in csv.reader(io.StringIO(chunk)):
+        if not row:  # csv.reader yields [] for blank lines
+            continue
+        game_id = row[gid_i].strip()
+        if not game_id:
+            continue
+        writer.writerow([game_id,
+                         row[iname_i].strip(),
+                         row[prov_i].strip(),
+                         'groovetech',
+                         row[name_i].strip()])
+        rows += 1
+
+    out.seek(0)
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {STAGE_TABLE} (game_id, internal_name, provider, "
+                f"integration_partner, name) FROM STDIN WITH CSV", out)
+        conn.commit()
+    finally:
+        conn.close()
+    return rows
+
+
+def _import_parallel(csv_file, columns):
+    """Parse and stage the CSV across all cores, then merge once."""
+    workers = cpu_count()
+    ranges = _chunk_ranges(csv_file, workers)
+
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {STAGE_TABLE}")
+            cursor.execute(f"""
+                CREATE UNLOGGED TABLE {STAGE_TABLE} (
+                    game_id text,
+                    internal_name text,
+                    provider text,
+                    integration_partner text,
+                    name text
+                )
+            """)
+        conn.commit()
+
+        with Pool(len(ranges)) as pool:
+            counts = pool.map(
+                _copy_range,
+                [(csv_file, start, end, columns) for start, end in ranges])
+        processed = sum(counts)
+        print(f"📊 Staged {processed} rows across {len(ranges)} workers")
+
+        with conn.cursor() as cursor:
+            _ensure_game_id_index(cursor)
+            cursor.execute(MERGE_SQL)
+            cursor.execute(f"DROP TABLE {STAGE_TABLE}")
+        conn.commit()
+        return processed
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def import_games_from_csv(csv_file):
+    """Upsert all games from the CSV in batches of BATCH_SIZE rows."""
+    with open(csv_file, 'r', encoding='utf-8') as file:
+        header = next(csv.reader(file))
+    idx = {column: i for i, column in enumerate(header)}
+    columns = (idx['game_id'], idx['internal_name'],
+               idx['provider.internal_name'], idx['name'])
+
+    if os.path.getsize(csv_file) >= PARALLEL_THRESHOLD_BYTES:
+        processed = _import_parallel(csv_file, columns)
+        print(f"✅ Import complete: {processed} games upserted")
+        return
+
+    gid_i, iname_i, prov_i, name_i = columns
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        _ensure_game_id_index(cursor)
+
+        with open(csv_file, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader)  # header
+
+            batch = []
+            processed = 0
+            for row in reader:
+                if not row:  # csv.reader yields [] for blank lines
+                    continue
+                game_id = row[gid_i].strip()
+                if not game_id:
+                    continue
+
+                batch.append((
+                    game_id,
+                    row[iname_i].strip(),
+                    row[prov_i].strip(),
+                    'groovetech',
+                    row[name_i].strip(),
+                ))
+
+                if len(batch) >= BATCH_SIZE:
+                    execute_values(cursor, UPSERT_SQL, batch,
+                                   page_size=BATCH_SIZE)
+                    processed += len(batch)
+                    batch.clear()
+                    print(f"📊 Processed {processed} rows...")
+
+            if batch:
+                execute_values(cursor, UPSERT_SQL, batch, page_size=BATCH_SIZE)
+                processed += len(batch)
+
+        conn.commit()
+        print(f"✅ Import complete: {processed} games upserted")
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Import failed: {e}")
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV_FILE
+    if not os.path.exists(csv_path):
+        print(f"❌ CSV file not found: {csv_path}")
+        sys.exit(1)
+    import_games_from_csv(csv_path)